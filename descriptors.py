@@ -2,25 +2,164 @@
 Dataclass field descriptors
 """
 
+import re
+import sys
 import uuid
 from dataclasses import MISSING
+from functools import lru_cache
+from math import isnan
 from typing import Optional, Callable, Union, Dict, Any, List
 from datetime import datetime
+from weakref import WeakKeyDictionary
 
 
 COMMON_DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
 
-DATE_FORMATS = [
+DATE_FORMATS = (
     COMMON_DATE_TIME_FORMAT,
     "%Y%m%dT%H%M%S",
     "%Y%m%dT%H%M",
     "%Y.%m.%d %H:%M",
-    "%Y%m%dT%H%M%S",
-]
+)
 
 
 _VALUE_NOT_SET = object()
 
+# whitespace stripped by int() and float(): \s minus the \x1c-\x1f separators
+_NUMBER_SPACE = r"[^\S\x1c-\x1f]*"
+
+# strings accepted by int(): optional sign, digits with single "_" separators
+_INT_STRING_RE = re.compile(_NUMBER_SPACE + r"[+-]?\d+(?:_\d+)*" + _NUMBER_SPACE)
+
+# strings accepted by float(): decimal/exponent notation, inf/infinity and nan
+_FLOAT_STRING_RE = re.compile(
+    _NUMBER_SPACE + r"[+-]?(?:"
+    r"(?:(?:\d(?:_?\d)*)?\.\d(?:_?\d)*|\d(?:_?\d)*\.?)(?:[eE][+-]?\d(?:_?\d)*)?"
+    # ASCII letters only: case folding would also accept "İnf" and "ınf"
+    r"|[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN]"
+    r")" + _NUMBER_SPACE
+)
+
+_UUID_SAFE_UNKNOWN = uuid.SafeUUID.unknown
+_UUID_HEX_LENGTH = 32
+
+
+def _parse_uuid(value: str) -> uuid.UUID:
+    """
+    Parse a UUID string.
+    The canonical 36-char form is converted directly from its hex digits,
+    any other form goes through uuid.UUID with the same validation rules.
+    """
+    if (
+        len(value) == 36
+        and value[8] == "-"
+        and value[13] == "-"
+        and value[18] == "-"
+        and value[23] == "-"
+    ):
+        hex_value = value.replace("-", "")
+        if len(hex_value) == _UUID_HEX_LENGTH:
+            # same as uuid.UUID(hex=...), minus the prefix/brace stripping
+            result = object.__new__(uuid.UUID)
+            object.__setattr__(result, "int", int(hex_value, 16))
+            object.__setattr__(result, "is_safe", _UUID_SAFE_UNKNOWN)
+            return result
+    return uuid.UUID(value)
+
+
+def _parse_fixed_width_date(value: str) -> Optional[datetime]:
+    """
+    Fast path for the fixed width forms of the first two DATE_FORMATS:
+    "%Y-%m-%dT%H:%M:%S" via fromisoformat() and "%Y%m%dT%H%M%S" via slicing.
+    With every digit position fixed, both give the same result as strptime(),
+    None means the value has to go through the DATE_FORMATS loop.
+    """
+    if not value.isascii():
+        return None
+    try:
+        if len(value) == 19:
+            if (
+                value[4] == "-"
+                and value[7] == "-"
+                and value[10] == "T"
+                and value[13] == ":"
+                and value[16] == ":"
+                and (value[:4] + value[5:7] + value[8:10]).isdigit()
+                and (value[11:13] + value[14:16] + value[17:]).isdigit()
+            ):
+                return datetime.fromisoformat(value)
+        elif len(value) == 15:
+            if value[8] == "T" and value[:8].isdigit() and value[9:].isdigit():
+                return datetime(
+                    int(value[:4]),
+                    int(value[4:6]),
+                    int(value[6:8]),
+                    int(value[9:11]),
+                    int(value[11:13]),
+                    int(value[13:]),
+                )
+    except ValueError:
+        # out of range parts, strptime rejects them as well
+        pass
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_with_formats(value: str) -> Optional[datetime]:
+    """
+    Parse a date string with the first matching DATE_FORMATS entry.
+    Results, including misses (None), are cached: repeated strings are common
+    in bulk imports and a miss costs one strptime exception per format.
+    Formats are always tried in order, since some inputs match several of them.
+    """
+    parsed = _parse_fixed_width_date(value)
+    if parsed is not None:
+        return parsed
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _format_naive_datetime(value: datetime, dt_format: str) -> str:
+    if dt_format == COMMON_DATE_TIME_FORMAT and value.year >= 1000:
+        # same output for naive values, %Y is not zero padded below year 1000
+        return value.isoformat(timespec="seconds")
+    return value.strftime(dt_format)
+
+
+def _format_datetime(value: datetime, dt_format: str) -> str:
+    """
+    strftime() with cached results for naive datetime values.
+    Aware values are not cached: equal aware datetimes may be in different timezones.
+    """
+    if type(value) is datetime and value.tzinfo is None:
+        return _format_naive_datetime(value, dt_format)
+    return value.strftime(dt_format)
+
+
+_HAS_REQUIRED_FIELDS_CACHE: WeakKeyDictionary[Any, bool] = WeakKeyDictionary()
+
+
+def _class_has_required_fields(object_class) -> bool:
+    """
+    Cached object_class.has_required_fields() result,
+    classes without this method are treated as having no required fields
+    """
+    has_required = _HAS_REQUIRED_FIELDS_CACHE.get(object_class)
+    if has_required is None:
+        try:
+            has_required_fields: Callable = object_class.has_required_fields
+        except AttributeError:
+            has_required = False
+        else:
+            has_required = bool(has_required_fields())
+        _HAS_REQUIRED_FIELDS_CACHE[object_class] = has_required
+    return has_required
+
 
 class ObjectFieldDescriptor:
     """
@@ -28,46 +167,96 @@ class ObjectFieldDescriptor:
     This is an abstract base class for all field descriptors in the module.
     """
 
-    def _get_stored_value(self, instance):
-        name = getattr(self, "_name", None)
-        if name is None:
-            return _VALUE_NOT_SET
-        return instance.__dict__.get(name, _VALUE_NOT_SET)
+    __slots__ = (
+        "_name",
+        "default",
+        "default_factory",
+        "_has_explicit_default",
+        "_has_explicit_default_factory",
+        "_value_factory",
+        "_default_is_constant",
+        "_cached_default",
+    )
 
     def _init_default_metadata(self, default=MISSING, default_factory=MISSING):
+        # unbound until __set_name__, a None key is never found in instance dicts
+        self._name = None
         self.default = default
         self.default_factory = default_factory
         self._has_explicit_default = default is not MISSING
         self._has_explicit_default_factory = default_factory is not MISSING
+        self._default_is_constant = False
+        self._cached_default = None
 
     def _set_value_factory(self, factory: Callable):
         self._value_factory = factory
+        self._default_is_constant = False
+
+    def _set_constant_default(self, value: Any):
+        """Use a fixed default value, returned as is without calling a factory"""
+        self._value_factory = self._get_cached_default
+        self._default_is_constant = True
+        self._cached_default = value
+
+    def _get_cached_default(self):
+        return self._cached_default
 
     def _call_default_factory(self):
+        if self._default_is_constant:
+            return self._cached_default
         return self._value_factory()
 
+    def _from_none(self, value):
+        """Setter handler: fall back to the default value"""
+        return self._call_default_factory()
+
 
 class FieldDescriptor:
     """"""
 
-    def _get_stored_value(self, instance):
-        name = getattr(self, "_name", None)
-        if name is None:
-            return _VALUE_NOT_SET
-        return instance.__dict__.get(name, _VALUE_NOT_SET)
+    __slots__ = (
+        "_name",
+        "default",
+        "default_factory",
+        "_has_explicit_default",
+        "_has_explicit_default_factory",
+        "_value_factory",
+        "_default_is_constant",
+        "_cached_default",
+    )
 
     def _init_default_metadata(self, default=MISSING, default_factory=MISSING):
+        # unbound until __set_name__, a None key is never found in instance dicts
+        self._name = None
         self.default = default
         self.default_factory = default_factory
         self._has_explicit_default = default is not MISSING
         self._has_explicit_default_factory = default_factory is not MISSING
+        self._default_is_constant = False
+        self._cached_default = None
 
     def _set_value_factory(self, factory: Callable):
         self._value_factory = factory
+        self._default_is_constant = False
+
+    def _set_constant_default(self, value: Any):
+        """Use a fixed default value, returned as is without calling a factory"""
+        self._value_factory = self._get_cached_default
+        self._default_is_constant = True
+        self._cached_default = value
+
+    def _get_cached_default(self):
+        return self._cached_default
 
     def _call_default_factory(self):
+        if self._default_is_constant:
+            return self._cached_default
         return self._value_factory()
 
+    def _from_none(self, value):
+        """Setter handler: fall back to the default value"""
+        return self._call_default_factory()
+
     def raise_on_value_missed(self):
         """ """
         raise ValueError("Value have no default value and must be set")
@@ -84,20 +273,34 @@ class StringWrapperObject:
 class DateTimeWrapper:
     """Export datetime field wrapper"""
 
+    # one wrapper is stored per datetime field value
+    __slots__ = ("_dt_value", "_dt_format")
+
     def __init__(self, dt_value: datetime, dt_format: str):
         self._dt_value = dt_value
         self._dt_format = dt_format
 
     def __str__(self):
         """str() handler using dt_format"""
-        return self._dt_value.strftime(self._dt_format)
+        return _format_datetime(self._dt_value, self._dt_format)
+
+    def strftime(self, dt_format: str) -> str:
+        """datetime.strftime() of the wrapped value"""
+        return _format_datetime(self._dt_value, dt_format)
 
     def __get__(self, instance, owner):
         return self._dt_value
 
     def __getattr__(self, name):
+        if name.startswith("_"):
+            # copy/pickle look up protocol attributes on an instance built
+            # without __init__, the slots may be unset and must not recurse
+            raise AttributeError(name)
         return getattr(self._dt_value, name)
 
+    def __reduce__(self):
+        return DateTimeWrapper, (self._dt_value, self._dt_format)
+
     def to_json(self, stringify=False):
         """
         Export method for serialization.
@@ -105,7 +308,7 @@ class DateTimeWrapper:
         or allows str() conversion when stringify=True.
         """
         if stringify:
-            return self._dt_value.strftime(self._dt_format)
+            return _format_datetime(self._dt_value, self._dt_format)
         return self._dt_value
 
 
@@ -117,6 +320,8 @@ class DateTimeDescriptor(FieldDescriptor):
             - several dt formats
     """
 
+    __slots__ = ("dt_format", "alias")
+
     def __init__(
         self,
         default: Any = MISSING,
@@ -135,9 +340,9 @@ class DateTimeDescriptor(FieldDescriptor):
         if callable(default_factory):
             self._set_value_factory(default_factory)
         elif default is None:
-            self._set_value_factory(lambda: None)
+            self._set_constant_default(None)
         elif isinstance(default, datetime):
-            self._set_value_factory(lambda: default)
+            self._set_constant_default(default)
         else:
             self._set_value_factory(self._default_time)
         self.dt_format = dt_format
@@ -149,39 +354,49 @@ class DateTimeDescriptor(FieldDescriptor):
         """
         if instance is None:
             return self
-        value = self._get_stored_value(instance)
+        # set values are stored already wrapped, see __set__
+        value = instance.__dict__.get(self._name, _VALUE_NOT_SET)
         if value is not _VALUE_NOT_SET:
-            if value is None:
-                return None
-            return DateTimeWrapper(value, dt_format=self.dt_format)
-        return self._call_default_factory()
+            return value
+        if self._default_is_constant:
+            return self._cached_default
+        return self._value_factory()
 
     def __set__(self, instance, value):
-        if value is None or value == "":
+        # the default is built only when it is used: the default factory is
+        # datetime.now() unless a default is given
+        if value is None:
             value = self._call_default_factory()
         elif isinstance(value, str):
-            value = self._parse_date_string(value, self._call_default_factory())
+            parsed = self._parse_date_string(value, None) if value else None
+            value = self._call_default_factory() if parsed is None else parsed
         elif isinstance(value, (int, float)):
-            value = self.parse_timestamp(value, self._call_default_factory())
+            parsed = self.parse_timestamp(value, None)
+            value = self._call_default_factory() if parsed is None else parsed
+        elif isinstance(value, DateTimeWrapper):
+            # value read from another datetime field
+            value = value._dt_value
         elif not isinstance(value, datetime):
             value = self._call_default_factory()
-        instance.__dict__[self._name] = value
+        # wrap once here, so reads are a plain lookup
+        instance.__dict__[self._name] = (
+            None if value is None else DateTimeWrapper(value, dt_format=self.dt_format)
+        )
 
     def __set_name__(self, owner, name):
-        self._name = name
+        self._name = sys.intern(name)
 
     def _parse_date_string(self, value, default):
         if self._is_timestamp_candidate(value):
             return self.parse_timestamp(value, default)
-        for date_format in DATE_FORMATS:
-            try:
-                return datetime.strptime(value, date_format)
-            except ValueError:
-                continue
-        return default
+        parsed = _parse_date_with_formats(value)
+        return default if parsed is None else parsed
 
     @staticmethod
     def _is_timestamp_candidate(value: Union[int, float, str]):
+        if isinstance(value, str):
+            # prefilter instead of catching ValueError for every date string
+            return _FLOAT_STRING_RE.fullmatch(value) is not None
         try:
             float(value)
             return True
@@ -222,6 +437,8 @@ class StringWrapperDescriptor(FieldDescriptor):
     assigned to its `value` attribute.
     """
 
+    __slots__ = ("object_class", "alias", "_setter_dispatch")
+
     def __init__(
         self,
         object_class,
@@ -230,49 +447,69 @@ class StringWrapperDescriptor(FieldDescriptor):
         alias: Optional[str] = None,
     ):
         self.object_class = object_class
+        # exact input type -> setter handler, later keys win on collisions
+        self._setter_dispatch = {
+            str: self._from_string,
+            dict: self._from_dict,
+            object_class: self._from_object,
+            type(None): self._from_none,
+        }
         self._init_default_metadata(default=default, default_factory=default_factory)
         if callable(default_factory):
             self._set_value_factory(default_factory)
         elif default is None:
-            self._set_value_factory(lambda: None)
+            self._set_constant_default(None)
         elif isinstance(default, object_class):
-            self._set_value_factory(lambda: default)
+            self._set_constant_default(default)
         else:
             # by default, create an empty object
-            self._set_value_factory(self._default_factory)
+            self._set_value_factory(object_class)
         self.alias = alias
 
     def __set_name__(self, owner, name):
-        self._name = name
+        self._name = sys.intern(name)
 
     def __get__(self, instance, owner):
         if instance is None:
             return self
-        value = self._get_stored_value(instance)
+        value = instance.__dict__.get(self._name, _VALUE_NOT_SET)
         if value is not _VALUE_NOT_SET:
             return value
-        return self._call_default_factory()
+        if self._default_is_constant:
+            return self._cached_default
+        return self._value_factory()
 
     def __set__(self, instance, value):
-        if value is None:
-            obj = self._call_default_factory()
-        elif isinstance(value, self.object_class):
-            obj = value
-        elif isinstance(value, dict):
-            # support for ImportJsonMixin, if a dictionary of constructor parameters is received
-            obj = self.object_class(**value)
-        else:
-            # interpret as a string according to requirements
-            obj = self.object_class()
-            try:
-                setattr(obj, "value", None if value is None else str(value))
-            except Exception:
-                # if object_class doesn't have a value field, leave it as default
-                pass
-        instance.__dict__[self._name] = obj
+        handler = self._setter_dispatch.get(type(value))
+        if handler is None:
+            handler = self._resolve_setter(value)
+        instance.__dict__[self._name] = handler(value)
+
+    def _resolve_setter(self, value):
+        """Setter handler lookup for subclasses of the expected input types"""
+        if isinstance(value, self.object_class):
+            return self._from_object
+        if isinstance(value, dict):
+            return self._from_dict
+        return self._from_string
 
-    def _default_factory(self):
-        return self.object_class()
+    @staticmethod
+    def _from_object(value):
+        return value
+
+    def _from_dict(self, value):
+        # support for ImportJsonMixin, if a dictionary of constructor parameters is received
+        return self.object_class(**value)
+
+    def _from_string(self, value):
+        # interpret as a string according to requirements
+        obj = self.object_class()
+        try:
+            obj.value = value if type(value) is str else str(value)
+        except Exception:
+            # if object_class doesn't have a value field, leave it as default
+            pass
+        return obj
 
 
 class FloatStringDescriptor(FieldDescriptor):
@@ -284,6 +521,8 @@ class FloatStringDescriptor(FieldDescriptor):
             - default value or default factory
     """
 
+    __slots__ = ("alias",)
+
     def __init__(
         self,
         default: Any = MISSING,
@@ -301,9 +540,9 @@ class FloatStringDescriptor(FieldDescriptor):
         if callable(default_factory):
             self._set_value_factory(default_factory)
         elif default is None:
-            self._set_value_factory(lambda: None)
+            self._set_constant_default(None)
         elif isinstance(default, (int, float)):
-            self._set_value_factory(lambda: float(default))
+            self._set_constant_default(float(default))
         else:
             self._set_value_factory(self.raise_on_value_missed)
         self.alias = alias
@@ -321,10 +560,12 @@ class FloatStringDescriptor(FieldDescriptor):
         """
         if instance is None:
             return self
-        value = self._get_stored_value(instance)
+        value = instance.__dict__.get(self._name, _VALUE_NOT_SET)
         if value is not _VALUE_NOT_SET:
             return value
-        return self._call_default_factory()
+        if self._default_is_constant:
+            return self._cached_default
+        return self._value_factory()
 
     def __set__(self, instance, value: Union[str, int, float, None]):
         """
@@ -334,13 +575,16 @@ class FloatStringDescriptor(FieldDescriptor):
             instance: The instance containing the attribute
             value: The value to set, can be a string, int, float, or None
         """
-        if value is None or value == "":
+        if value is None:
             value = self._call_default_factory()
         elif isinstance(value, str):
-            try:
+            # prefilter instead of catching ValueError for every invalid string
+            if _FLOAT_STRING_RE.fullmatch(value) is not None:
                 value = float(value)
-            except ValueError:
+            else:
                 value = self._call_default_factory()
+        elif type(value) is float:
+            pass  # already good
         elif isinstance(value, (int, float)):
             value = float(value)
         else:
@@ -355,7 +599,7 @@ class FloatStringDescriptor(FieldDescriptor):
             owner: The class that owns the attribute
             name: The name of the attribute
         """
-        self._name = name
+        self._name = sys.intern(name)
 
 
 class IntStringDescriptor(FieldDescriptor):
@@ -367,6 +611,8 @@ class IntStringDescriptor(FieldDescriptor):
             - default value or default factory
     """
 
+    __slots__ = ("alias",)
+
     def __init__(
         self,
         default: Any = MISSING,
@@ -384,9 +630,9 @@ class IntStringDescriptor(FieldDescriptor):
         if callable(default_factory):
             self._set_value_factory(default_factory)
         elif default is None:
-            self._set_value_factory(lambda: None)
+            self._set_constant_default(None)
         elif isinstance(default, (int, float)):
-            self._set_value_factory(lambda: int(default))
+            self._set_constant_default(int(default))
         else:
             self._set_value_factory(self.raise_on_value_missed)
         self.alias = alias
@@ -404,10 +650,12 @@ class IntStringDescriptor(FieldDescriptor):
         """
         if instance is None:
             return self
-        value = self._get_stored_value(instance)
+        value = instance.__dict__.get(self._name, _VALUE_NOT_SET)
         if value is not _VALUE_NOT_SET:
             return value
-        return self._call_default_factory()
+        if self._default_is_constant:
+            return self._cached_default
+        return self._value_factory()
 
     def __set__(self, instance, value: Union[str, int, float, None]):
         """
@@ -417,12 +665,16 @@ class IntStringDescriptor(FieldDescriptor):
             instance: The instance containing the attribute
             value: The value to set, can be a string, int, float, or None
         """
-        if value is None or value == "":
+        if value is None:
             value = self._call_default_factory()
         elif isinstance(value, str):
-            try:
-                value = int(float(value))  # на случай строки вроде "12.0"
-            except ValueError:
+            # prefilter instead of catching ValueError for every invalid string
+            if _INT_STRING_RE.fullmatch(value) is not None:
+                value = int(value)
+            elif _FLOAT_STRING_RE.fullmatch(value) is not None:
+                value = float(value)  # на случай строки вроде "12.0"
+                value = self._call_default_factory() if isnan(value) else int(value)
+            else:
                 value = self._call_default_factory()
         elif isinstance(value, (int, float)):
             value = int(value)
@@ -438,7 +690,7 @@ class IntStringDescriptor(FieldDescriptor):
             owner: The class that owns the attribute
             name: The name of the attribute
         """
-        self._name = name
+        self._name = sys.intern(name)
 
 
 class IntStringToBoolDescriptor(FieldDescriptor):
@@ -451,6 +703,8 @@ class IntStringToBoolDescriptor(FieldDescriptor):
             - default value or default factory
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         default: Any = MISSING,
@@ -460,32 +714,34 @@ class IntStringToBoolDescriptor(FieldDescriptor):
         if callable(default_factory):
             self._set_value_factory(default_factory)
         elif default is None:
-            self._set_value_factory(lambda: None)
+            self._set_constant_default(None)
         elif isinstance(default, bool):
-            self._set_value_factory(lambda: default)
+            self._set_constant_default(default)
         else:
             self._set_value_factory(self._default_bool)
 
     def __get__(self, instance, owner):
         if instance is None:
             return self
-        value = self._get_stored_value(instance)
+        value = instance.__dict__.get(self._name, _VALUE_NOT_SET)
         if value is not _VALUE_NOT_SET:
             return value
-        return self._call_default_factory()
+        if self._default_is_constant:
+            return self._cached_default
+        return self._value_factory()
 
     def __set__(self, instance, value: Union[str, int, bool, None]):
-        if value is None or value == "":
+        if value is None:
             value = self._call_default_factory()
         elif isinstance(value, bool):
             pass  # already good
         elif isinstance(value, int):
             value = bool(value)
         elif isinstance(value, str):
-            try:
+            if _INT_STRING_RE.fullmatch(value) is not None:
                 value = bool(int(value))
-            except ValueError:
-                # fallback: "true"/"false" style strings
+            else:
+                # fallback: "true"/"false" style strings, "" gets the default
                 lowered = value.strip().lower()
                 if lowered in ("true", "yes", "y", "on"):
                     value = True
@@ -498,7 +754,7 @@ class IntStringToBoolDescriptor(FieldDescriptor):
         instance.__dict__[self._name] = value
 
     def __set_name__(self, owner, name):
-        self._name = name
+        self._name = sys.intern(name)
 
     @staticmethod
     def _default_bool():
@@ -507,6 +763,8 @@ class IntStringToBoolDescriptor(FieldDescriptor):
 
 
 class SingleObjectDescriptor(ObjectFieldDescriptor):
+    __slots__ = ("_optional", "object_class", "alias", "_setter_dispatch")
+
     def __init__(
         self,
         object_class,
@@ -525,19 +783,26 @@ class SingleObjectDescriptor(ObjectFieldDescriptor):
         """
         self._optional = optional
         self.object_class = object_class
+        # exact input type -> setter handler, later keys win on collisions
+        self._setter_dispatch = {
+            object_class: self._from_object,
+            dict: self._from_dict,
+            type(None): self._from_none,
+        }
         self._init_default_metadata(default=default, default_factory=default_factory)
         if callable(default_factory):
             self._set_value_factory(default_factory)
         elif default is None:
-            self._set_value_factory(lambda: None)
+            self._set_constant_default(None)
         elif isinstance(default, object_class):
-            self._set_value_factory(lambda: default)  # Преобразуем объект в фабрику
+            self._set_constant_default(default)
         elif self._optional:
-            self._set_value_factory(lambda: None)
+            self._set_constant_default(None)
         elif self.has_required_fields():
             self._set_value_factory(self._raise_no_default)
         else:
-            self._set_value_factory(self._default_factory)
+            # empty object, the class itself is the factory
+            self._set_value_factory(object_class)
         self.alias = alias
 
     def __get__(self, instance, owner):
@@ -547,25 +812,44 @@ class SingleObjectDescriptor(ObjectFieldDescriptor):
         if instance is None:
             return self
         # Возвращаем значение из __dict__ экземпляра, если оно существует
-        if self._name not in instance.__dict__:
-            instance.__dict__[self._name] = self._call_default_factory()
-        return instance.__dict__[self._name]
+        name = self._name
+        instance_dict = instance.__dict__
+        value = instance_dict.get(name, _VALUE_NOT_SET)
+        if value is not _VALUE_NOT_SET:
+            return value
+        if self._default_is_constant:
+            # shared constant (None for optional fields) is not copied into __dict__
+            return self._cached_default
+        value = self._value_factory()
+        instance_dict[name] = value
+        return value
 
     def __set__(self, instance, value):
         """
         Setter for field value
         """
-        if value is None:
-            value = self._call_default_factory()
-        elif isinstance(value, dict):
-            value = self.object_class(**value)
-        elif not isinstance(value, self.object_class):
-            # value = self.default_factory()
-            raise ValueError(
-                f"Value must be a dict or a {self.object_class.__name__} instance, not {type(value)}: {value}"
-            )
+        handler = self._setter_dispatch.get(type(value))
+        if handler is None:
+            handler = self._resolve_setter(value)
         # Сохраняем значение в __dict__ экземпляра
-        instance.__dict__[self._name] = value
+        instance.__dict__[self._name] = handler(value)
+
+    def _resolve_setter(self, value):
+        """Setter handler lookup for subclasses of the expected input types"""
+        if isinstance(value, dict):
+            return self._from_dict
+        if isinstance(value, self.object_class):
+            return self._from_object
+        raise ValueError(
+            f"Value must be a dict or a {self.object_class.__name__} instance, not {type(value)}: {value}"
+        )
+
+    @staticmethod
+    def _from_object(value):
+        return value
+
+    def _from_dict(self, value):
+        return self.object_class(**value)
 
     def __set_name__(self, owner, name):
         """
@@ -576,23 +860,24 @@ class SingleObjectDescriptor(ObjectFieldDescriptor):
             name: The name of the attribute
         """
         # Запоминаем имя атрибута, чтобы хранить значение в __dict__
-        self._name = name
+        self._name = sys.intern(name)
 
     def _raise_no_default(self):
         raise ValueError(f"No default value or factory for {self._name}")
 
     def has_required_fields(self):
-        has_required_fields: Callable = getattr(
-            self.object_class, "has_required_fields"
-        )
-        return has_required_fields and has_required_fields()
-
-    def _default_factory(self):
-        """Empty search filter"""
-        return self.object_class()
+        return _class_has_required_fields(self.object_class)
 
 
 class ObjectListDescriptor(ObjectFieldDescriptor):
+    __slots__ = (
+        "object_class",
+        "alias",
+        "_setter_dispatch",
+        "_default_snapshot",
+        "_item_types",
+    )
+
     def __init__(
         self,
         object_class,
@@ -609,15 +894,21 @@ class ObjectListDescriptor(ObjectFieldDescriptor):
             default_factory: Optional callable that returns a default list of objects
         """
         self.object_class = object_class
+        # exact item types recognized without isinstance checks
+        self._item_types = frozenset((dict, object_class))
+        self._setter_dispatch = {list: self._from_list, type(None): self._from_none}
         self._init_default_metadata(default=default, default_factory=default_factory)
         if callable(default_factory):
             self._set_value_factory(default_factory)
         elif default is None:
-            self._set_value_factory(lambda: None)
+            self._set_constant_default(None)
         elif isinstance(default, list):
-            self._set_value_factory(lambda: default)
+            # every instance gets its own copy of the default list
+            self._default_snapshot = tuple(default)
+            self._set_value_factory(self._copy_default)
         else:
-            self._set_value_factory(self._default_factory)
+            # empty list, the builtin type is the factory
+            self._set_value_factory(list)
         self.alias = alias
 
     def __get__(self, instance, owner):
@@ -626,27 +917,47 @@ class ObjectListDescriptor(ObjectFieldDescriptor):
         """
         if instance is None:
             return self
-        # return instance.__dict__.get(self._name)
-        value = self._get_stored_value(instance)
+        name = self._name
+        instance_dict = instance.__dict__
+        value = instance_dict.get(name, _VALUE_NOT_SET)
         if value is not _VALUE_NOT_SET:
             return value
-        return self._call_default_factory()
+        if self._default_is_constant:
+            return self._cached_default
+        # store the built container, so in-place changes are kept
+        value = self._value_factory()
+        instance_dict[name] = value
+        return value
 
     def __set__(self, instance, value):
         """
         Setter for field value
         """
-        if value is None or not isinstance(value, list):
-            value = self._call_default_factory()
-        else:
-            new_value = []
-            for object_dto in value:
-                if isinstance(object_dto, dict):
-                    new_value.append(self.object_class(**object_dto))
-                elif isinstance(object_dto, self.object_class):
-                    new_value.append(object_dto)
-            value = new_value
-        instance.__dict__[self._name] = value
+        handler = self._setter_dispatch.get(type(value))
+        if handler is None:
+            handler = self._from_list if isinstance(value, list) else self._from_none
+        instance.__dict__[self._name] = handler(value)
+
+    def _from_list(self, value):
+        object_class = self.object_class
+        accepted = (dict, object_class)
+        exact_types = self._item_types
+        # exact dicts (the JSON case) and object_class instances (round trips)
+        # are recognized by type identity, subclasses fall back to isinstance;
+        # items that are neither dicts nor object_class instances are skipped
+        return [
+            (
+                object_dto
+                if type(object_dto) is object_class
+                else (
+                    object_class(**object_dto)
+                    if isinstance(object_dto, dict)
+                    else object_dto
+                )
+            )
+            for object_dto in value
+            if type(object_dto) in exact_types or isinstance(object_dto, accepted)
+        ]
 
     def __set_name__(self, owner, name):
         """
@@ -656,15 +967,21 @@ class ObjectListDescriptor(ObjectFieldDescriptor):
             owner: The class that owns the attribute
             name: The name of the attribute
         """
-        self._name = name
+        self._name = sys.intern(name)
 
-    @staticmethod
-    def _default_factory():
-        """Empty search filter"""
-        return []
+    def _copy_default(self):
+        return list(self._default_snapshot)
 
 
 class MapObjectDescriptor(ObjectFieldDescriptor):
+    __slots__ = (
+        "object_class",
+        "alias",
+        "_setter_dispatch",
+        "_default_snapshot",
+        "_item_types",
+    )
+
     def __init__(
         self,
         object_class,
@@ -681,15 +998,21 @@ class MapObjectDescriptor(ObjectFieldDescriptor):
             default_factory: Optional callable that returns a default dictionary of objects
         """
         self.object_class = object_class
+        # exact item types recognized without isinstance checks
+        self._item_types = frozenset((dict, object_class))
+        self._setter_dispatch = {dict: self._from_dict, type(None): self._from_none}
         self._init_default_metadata(default=default, default_factory=default_factory)
         if callable(default_factory):
             self._set_value_factory(default_factory)
         elif default is None:
-            self._set_value_factory(lambda: None)
+            self._set_constant_default(None)
         elif isinstance(default, dict):
-            self._set_value_factory(lambda: default)
+            # every instance gets its own copy of the default dict
+            self._default_snapshot = dict(default)
+            self._set_value_factory(self._copy_default)
         else:
-            self._set_value_factory(self._default_factory)
+            # empty dict, the builtin type is the factory
+            self._set_value_factory(dict)
         self.alias = alias
 
     def __get__(self, instance, owner):
@@ -698,28 +1021,47 @@ class MapObjectDescriptor(ObjectFieldDescriptor):
         """
         if instance is None:
             return self
-        value = self._get_stored_value(instance)
+        name = self._name
+        instance_dict = instance.__dict__
+        value = instance_dict.get(name, _VALUE_NOT_SET)
         if value is not _VALUE_NOT_SET:
             return value
-        return self._call_default_factory()
+        if self._default_is_constant:
+            return self._cached_default
+        # store the built container, so in-place changes are kept
+        value = self._value_factory()
+        instance_dict[name] = value
+        return value
 
     def __set__(self, instance, value: Optional[Dict[str, Any]]):
         """
         Setter for field value
         """
-        if not isinstance(value, dict):
-            value = self._call_default_factory()
-        else:
-            result = {}
-            for key, obj_data in value.items():
-                if isinstance(obj_data, self.object_class):
-                    result[key] = obj_data
-                elif isinstance(obj_data, dict):
-                    result[key] = self.object_class(**obj_data)
-                # else:
-                #     result[key] = obj_data
-            value = result
-        instance.__dict__[self._name] = value
+        handler = self._setter_dispatch.get(type(value))
+        if handler is None:
+            handler = self._from_dict if isinstance(value, dict) else self._from_none
+        instance.__dict__[self._name] = handler(value)
+
+    def _from_dict(self, value):
+        object_class = self.object_class
+        accepted = (object_class, dict)
+        exact_types = self._item_types
+        # exact dicts (the JSON case) and object_class instances (round trips)
+        # are recognized by type identity, subclasses fall back to isinstance;
+        # values that are neither object_class instances nor dicts are skipped
+        return {
+            key: (
+                obj_data
+                if type(obj_data) is object_class
+                else (
+                    object_class(**obj_data)
+                    if type(obj_data) is dict or not isinstance(obj_data, object_class)
+                    else obj_data
+                )
+            )
+            for key, obj_data in value.items()
+            if type(obj_data) in exact_types or isinstance(obj_data, accepted)
+        }
 
     def __set_name__(self, owner, name):
         """
@@ -729,12 +1071,10 @@ class MapObjectDescriptor(ObjectFieldDescriptor):
             owner: The class that owns the attribute
             name: The name of the attribute
         """
-        self._name = name
+        self._name = sys.intern(name)
 
-    @staticmethod
-    def _default_factory():
-        """ """
-        return {}
+    def _copy_default(self):
+        return dict(self._default_snapshot)
 
 
 class StrUuidDescriptor(FieldDescriptor):
@@ -746,6 +1086,8 @@ class StrUuidDescriptor(FieldDescriptor):
             - default value or default factory
     """
 
+    __slots__ = ("_raise_on_error",)
+
     def __init__(
         self,
         default: Any = MISSING,
@@ -757,74 +1099,84 @@ class StrUuidDescriptor(FieldDescriptor):
         if callable(default_factory):
             self._set_value_factory(default_factory)
         elif default is None:
-            self._set_value_factory(lambda: None)
+            self._set_constant_default(None)
         elif isinstance(default, uuid.UUID):
-            self._set_value_factory(lambda: default)
+            self._set_constant_default(default)
         elif isinstance(default, str):
             try:
                 parsed = uuid.UUID(default)
-                self._set_value_factory(lambda: parsed)
+                self._set_constant_default(parsed)
             except (ValueError, TypeError) as err:
                 if self._raise_on_error:
                     raise err
                 self._set_value_factory(self.raise_on_value_missed)
         elif isinstance(default, uuid.UUID):
-            self._set_value_factory(lambda: default)
+            self._set_constant_default(default)
         else:
             self._set_value_factory(self.raise_on_value_missed)
 
     def __get__(self, instance, owner):
         if instance is None:
             return self
-        value = self._get_stored_value(instance)
+        value = instance.__dict__.get(self._name, _VALUE_NOT_SET)
         if value is not _VALUE_NOT_SET:
             return value
-        return self._call_default_factory()
+        if self._default_is_constant:
+            return self._cached_default
+        return self._value_factory()
 
     def __set__(self, instance, value: Union[str, uuid.UUID, None]):
-        if value is None or value == "":
+        value_type = type(value)
+        if value is None:
             value = self._call_default_factory()
-        elif isinstance(value, uuid.UUID):
+        elif value_type is uuid.UUID:
             pass
-        elif isinstance(value, str):
-            try:
-                value = uuid.UUID(value)
-            except ValueError as err:
-                if self._raise_on_error:
-                    raise Exception(f"{value} is not valid UUID").with_traceback(
-                        err.__traceback__
-                    )
-                value = self._call_default_factory()
-            except TypeError as err:
-                if self._raise_on_error:
-                    raise Exception(
-                        f"{type(value)} is not valid type for UUID "
-                    ).with_traceback(err.__traceback__)
-                value = self._call_default_factory()
-            except Exception as err:
-                if self._raise_on_error:
-                    raise Exception(
-                        f"Unexpected exception with value: {str(value)} {err}"
-                    ).with_traceback(err.__traceback__)
-                value = self._call_default_factory()
-        elif isinstance(
-            value, type(self)
-        ):  # не задано значение по-умолчанию - передается экземпляр дескриптора
-            # Не передано значение и нет дефолтного
-            if self._raise_on_error and self.default_factory is MISSING:
-                raise Exception(f"Unsupported type: {str(value)}")
-            value = self._call_default_factory()
+        elif value_type is str:
+            value = self._parse_string(value)
         else:
-            raise Exception(f"Unsupported type {value}: {type(value)}")
+            value = self._coerce_other(value)
         instance.__dict__[self._name] = value
 
     def __set_name__(self, owner, name):
-        self._name = name
+        self._name = sys.intern(name)
+
+    def _parse_string(self, value: str):
+        if value == "":
+            return self._call_default_factory()
+        if len(value) < _UUID_HEX_LENGTH:
+            # too short to hold 32 hex digits, skip the parse attempt
+            if self._raise_on_error:
+                raise Exception(f"{value} is not valid UUID")
+            return self._call_default_factory()
+        try:
+            return _parse_uuid(value)
+        except (ValueError, TypeError) as err:
+            if self._raise_on_error:
+                raise Exception(f"{value} is not valid UUID").with_traceback(
+                    err.__traceback__
+                )
+            return self._call_default_factory()
+
+    def _coerce_other(self, value):
+        """Slow path: subclasses of the supported types and unsupported values"""
+        if isinstance(value, uuid.UUID):
+            return value
+        if isinstance(value, str):
+            return self._parse_string(value)
+        if isinstance(value, type(self)):
+            # не задано значение по-умолчанию - передается экземпляр дескриптора
+            # Не передано значение и нет дефолтного
+            if self._raise_on_error and self.default_factory is MISSING:
+                raise Exception(f"Unsupported type: {str(value)}")
+            return self._call_default_factory()
+        raise Exception(f"Unsupported type {value}: {type(value)}")
 
 
 class BoolToIntDescriptor(FieldDescriptor):
     """Descriptor that coerces various truthy/falsey inputs to integer 1/0."""
 
+    __slots__ = ("alias",)
+
     def __init__(
         self,
         default: Any = MISSING,
@@ -835,32 +1187,31 @@ class BoolToIntDescriptor(FieldDescriptor):
         if callable(default_factory):
             self._set_value_factory(default_factory)
         elif default is None:
-            self._set_value_factory(lambda: None)
+            self._set_constant_default(None)
         elif isinstance(default, (bool, int)):
-            self._set_value_factory(lambda: int(bool(default)))
+            self._set_constant_default(int(bool(default)))
         else:
             self._set_value_factory(self.raise_on_value_missed)
         self.alias = alias
 
     def __set_name__(self, owner, name):
-        self._name = name
+        self._name = sys.intern(name)
 
     def __get__(self, instance, owner):
         if instance is None:
             return self
-        value = self._get_stored_value(instance)
+        value = instance.__dict__.get(self._name, _VALUE_NOT_SET)
         if value is not _VALUE_NOT_SET:
             return value
-        return self._call_default_factory()
+        if self._default_is_constant:
+            return self._cached_default
+        return self._value_factory()
 
     def __set__(self, instance, value: Union[bool, int, None]):
         # Allow ImportJsonMixin to pass whole kwargs
-        if value is None:
-            result = self._call_default_factory()
-        elif isinstance(value, bool):
-            result = int(value)
-        elif isinstance(value, int):
-            result = 1 if value != 0 else 0
+        value_type = type(value)
+        if value_type is int or value_type is bool or isinstance(value, int):
+            result = 1 if value else 0
         else:
             # Only bool/int are allowed per requirements
             result = self._call_default_factory()
@@ -872,6 +1223,8 @@ class ListOfIntDescriptor(FieldDescriptor):
     Priority: value > factory > default
     """
 
+    __slots__ = ("alias", "_default_snapshot")
+
     def __init__(
         self,
         default: Any = MISSING,
@@ -882,18 +1235,29 @@ class ListOfIntDescriptor(FieldDescriptor):
         if callable(default_factory):
             self._set_value_factory(default_factory)
         elif default is None:
-            self._set_value_factory(lambda: None)
+            self._set_constant_default(None)
         elif isinstance(default, list):
-            # copy to avoid shared list
-            self._set_value_factory(
-                lambda: [int(x) for x in default if self._can_int(x)]
-            )
+            # validate once, every instance gets its own copy of the list
+            self._default_snapshot = tuple(int(x) for x in default if self._can_int(x))
+            self._set_value_factory(self._copy_default)
         else:
             self._set_value_factory(self.raise_on_value_missed)
         self.alias = alias
 
+    def _copy_default(self):
+        return list(self._default_snapshot)
+
     @staticmethod
     def _can_int(x: Any) -> bool:
+        """Whether int(str(x)) succeeds, checked without raising where possible"""
+        x_type = type(x)
+        if x_type is int:
+            return True
+        if x_type is str:
+            return _INT_STRING_RE.fullmatch(x) is not None
+        if x_type is float or x_type is bool:
+            # str() gives "1.5", "1e+20", "inf", "True"... never an int literal
+            return False
         try:
             int(str(x))
             return True
@@ -901,34 +1265,52 @@ class ListOfIntDescriptor(FieldDescriptor):
             return False
 
     def __set_name__(self, owner, name):
-        self._name = name
+        self._name = sys.intern(name)
 
     def __get__(self, instance, owner):
         if instance is None:
             return self
-        value = self._get_stored_value(instance)
+        value = instance.__dict__.get(self._name, _VALUE_NOT_SET)
         if value is not _VALUE_NOT_SET:
             return value
-        return self._call_default_factory()
+        if self._default_is_constant:
+            return self._cached_default
+        return self._value_factory()
 
     def __set__(self, instance, value: Union[List[Any], None]):
         if isinstance(value, list):
-            result = []
-            for item in value:
-                try:
-                    result.append(int(item))
-                except Exception:
-                    # skip non-convertible items
-                    pass
+            try:
+                # fast path: every item is convertible, map() loops in C
+                result = list(map(int, value))
+            except Exception:
+                result = self._coerce_items(value)
         else:
             # Only list is accepted per requirements
             result: List[int] = self._call_default_factory()
         instance.__dict__[self._name] = result
 
+    @staticmethod
+    def _coerce_items(value: List[Any]) -> List[int]:
+        result = []
+        for item in value:
+            if type(item) is str:
+                if _INT_STRING_RE.fullmatch(item) is not None:
+                    result.append(int(item))
+                # skip non-convertible strings without raising
+                continue
+            try:
+                result.append(int(item))
+            except Exception:
+                # skip non-convertible items
+                pass
+        return result
+
 
 class ListOfUuidDescriptor(FieldDescriptor):
     """Descriptor that ensures a list of UUIDs (uuid.UUID). Accepts strings too."""
 
+    __slots__ = ("_raise_on_error", "alias", "_default_snapshot")
+
     def __init__(
         self,
         default: Any = MISSING,
@@ -941,56 +1323,85 @@ class ListOfUuidDescriptor(FieldDescriptor):
         if callable(default_factory):
             self._set_value_factory(default_factory)
         elif default is None:
-            self._set_value_factory(lambda: None)
+            self._set_constant_default(None)
         elif isinstance(default, list):
-            # copy with validation
-            def _df():
-                res = []
-                for x in default:
-                    if isinstance(x, uuid.UUID):
-                        res.append(x)
-                    elif isinstance(x, str):
-                        try:
-                            res.append(uuid.UUID(x))
-                        except (ValueError, TypeError) as err:
-                            if self._raise_on_error:
-                                raise err
-                return res
-
-            self._set_value_factory(_df)
+            # validate once, every instance gets its own copy of the list
+            snapshot = []
+            for x in default:
+                if isinstance(x, uuid.UUID):
+                    snapshot.append(x)
+                elif isinstance(x, str):
+                    try:
+                        snapshot.append(uuid.UUID(x))
+                    except (ValueError, TypeError) as err:
+                        if self._raise_on_error:
+                            raise err
+            self._default_snapshot = tuple(snapshot)
+            self._set_value_factory(self._copy_default)
         else:
             self._set_value_factory(self.raise_on_value_missed)
         self.alias = alias
 
+    def _copy_default(self):
+        return list(self._default_snapshot)
+
     def __set_name__(self, owner, name):
-        self._name = name
+        self._name = sys.intern(name)
 
     def __get__(self, instance, owner):
         if instance is None:
             return self
-        value = self._get_stored_value(instance)
+        value = instance.__dict__.get(self._name, _VALUE_NOT_SET)
         if value is not _VALUE_NOT_SET:
             return value
-        return self._call_default_factory()
+        if self._default_is_constant:
+            return self._cached_default
+        return self._value_factory()
 
     def __set__(self, instance, value: Union[List[Union[str, uuid.UUID, Any]], None]):
         if value is None:
             result: List[uuid.UUID] = self._call_default_factory()
         elif isinstance(value, list):
-            result = []
-            for item in value:
-                if isinstance(item, uuid.UUID):
-                    result.append(item)
-                else:
-                    try:
-                        result.append(uuid.UUID(str(item)))
-                    except Exception as err:
-                        if self._raise_on_error:
-                            raise Exception(
-                                f"Invalid UUID value: {item}"
-                            ).with_traceback(err.__traceback__)
-                        # skip invalid
+            uuid_type = uuid.UUID
+            parse_uuid = _parse_uuid
+            try:
+                # fast path: every item is valid, strings are parsed without str()
+                # and UUID subclass instances are kept as they are
+                result = [
+                    (
+                        item
+                        if type(item) is uuid_type
+                        else (
+                            parse_uuid(item)
+                            if type(item) is str
+                            else (
+                                item
+                                if isinstance(item, uuid_type)
+                                else parse_uuid(str(item))
+                            )
+                        )
+                    )
+                    for item in value
+                ]
+            except Exception:
+                result = self._coerce_items(value)
         else:
             # Only list is accepted
             result = self._call_default_factory()
         instance.__dict__[self._name] = result
+
+    def _coerce_items(self, value: List[Any]) -> List[uuid.UUID]:
+        result = []
+        for item in value:
+            if isinstance(item, uuid.UUID):
+                result.append(item)
+            else:
+                try:
+                    result.append(uuid.UUID(str(item)))
+                except Exception as err:
+                    if self._raise_on_error:
+                        raise Exception(f"Invalid UUID value: {item}").with_traceback(
+                            err.__traceback__
+                        )
+                    # skip invalid
+        return result
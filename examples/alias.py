@@ -4,18 +4,16 @@ Alias usage example
 from dataclasses import dataclass, field
 
 from descriptors import IntStringDescriptor
-from mixins import ImportJsonMixin, ExportJsonMixin
+from mixins import ImportJsonMixin, ExportJsonMixin, fast_init
 
 
+@fast_init
 @dataclass
 class Model(ImportJsonMixin, ExportJsonMixin):
     """ Some model """
     foo: str = field(default=IntStringDescriptor(default=None))
     a_foo: str = field(default=IntStringDescriptor(default_factory=lambda: None, alias="@foo"))
 
-    def __init__(self, **kwargs):
-        ImportJsonMixin.__init__(self, **kwargs)
-
 
 if __name__ == "__main__":
     data = {
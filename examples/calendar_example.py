@@ -6,9 +6,10 @@ from typing import List
 from dataclasses import dataclass, field
 from datetime import datetime, date
 from descriptors import DateTimeDescriptor, COMMON_DATE_TIME_FORMAT, ObjectListDescriptor
-from mixins import ImportJsonMixin
+from mixins import ImportJsonMixin, fast_init
 
 
+@fast_init
 @dataclass
 class CalendarDay(ImportJsonMixin):
     """
@@ -51,12 +52,6 @@ class CalendarDay(ImportJsonMixin):
         """
         return self.current_day.year
 
-    def __init__(self, **kwargs):
-        """
-        Initialize a ImportJsonMixin instance from keyword arguments.
-        """
-        ImportJsonMixin.__init__(self, **kwargs)
-
     def to_json(self):
         """
         Convert the CalendarDay instance to a JSON-serializable dictionary.
@@ -70,6 +65,7 @@ class CalendarDay(ImportJsonMixin):
         }
 
 
+@fast_init
 @dataclass
 class Calendar(ImportJsonMixin):
     """
@@ -82,12 +78,6 @@ class Calendar(ImportJsonMixin):
     current_date: datetime = field(default=DateTimeDescriptor())
     days: List[CalendarDay] = field(default=ObjectListDescriptor(CalendarDay))
 
-    def __init__(self, **kwargs):
-        """
-        Initialize a ImportJsonMixin instance from keyword arguments.
-        """
-        ImportJsonMixin.__init__(self, **kwargs)
-
     def to_json(self):
         """
         Convert the Calendar instance to a JSON-serializable dictionary.
@@ -97,7 +87,7 @@ class Calendar(ImportJsonMixin):
         """
         return {
             "current_date": self.current_date.strftime(COMMON_DATE_TIME_FORMAT),
-            "days": [calendar_day.to_json() for calendar_day in self.days],
+            "days": list(map(CalendarDay.to_json, self.days)),
         }
 
 
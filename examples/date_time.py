@@ -5,20 +5,15 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 from descriptors import DateTimeDescriptor
-from mixins import ImportJsonMixin, ExportJsonMixin
+from mixins import ImportJsonMixin, ExportJsonMixin, fast_init
 
 
+@fast_init
 @dataclass
 class DateTimeModel(ImportJsonMixin, ExportJsonMixin):
     """ Datetime field descriptor usage example """
     current_date: datetime = field(default=DateTimeDescriptor(dt_format="%Y-%m-%d"))
 
-    def __init__(self, **kwargs):
-        """
-        Initialize a ImportJsonMixin instance from keyword arguments.
-        """
-        ImportJsonMixin.__init__(self, **kwargs)
-
 
 if __name__ == "__main__":
     data = {
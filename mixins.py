@@ -3,8 +3,10 @@ Dataclass based serializer
 + export and import mixins
 """
 
-from dataclasses import MISSING, dataclass, fields, is_dataclass
-from typing import Any, Dict
+import inspect
+from dataclasses import MISSING, dataclass, fields
+from typing import Any, Callable, Dict, List, Tuple
+from weakref import WeakKeyDictionary
 
 from descriptors import FieldDescriptor, ObjectFieldDescriptor
 
@@ -13,18 +15,18 @@ class MissingRequiredFieldsError(Exception):
     """Raised when required fields are missing in input data."""
 
 
-@dataclass
-class ImportJsonMixin:
+_IMPORT_FIELDS_CACHE: WeakKeyDictionary[type, Tuple[tuple, ...]] = WeakKeyDictionary()
+
+
+def _get_import_fields(cls) -> Tuple[tuple, ...]:
     """
-    Add support for importing a dict object with any keys,
-    even if they are not expected in the current dataclass.
-    Only the fields defined in the dataclass will be used.
+    Field metadata used by ImportJsonMixin, built once per dataclass:
+    (name, descriptor, alias, is_object_descriptor, default, default_factory)
     """
-
-    def __init__(self, **kwargs):
-        self.validate_required_fields(kwargs)
-        sf_fields = {sf_field.name: sf_field for sf_field in fields(self)}
-        for name, sf_field in sf_fields.items():
+    import_fields = _IMPORT_FIELDS_CACHE.get(cls)
+    if import_fields is None:
+        import_fields_list = []
+        for sf_field in fields(cls):
             descriptor = (
                 sf_field.default
                 if isinstance(
@@ -32,36 +34,299 @@ class ImportJsonMixin:
                 )
                 else None
             )
-            input_key = name
-            descriptor_alias = (
-                getattr(descriptor, "alias", None) if descriptor is not None else None
+            import_fields_list.append(
+                (
+                    sf_field.name,
+                    descriptor,
+                    getattr(descriptor, "alias", None),
+                    isinstance(descriptor, ObjectFieldDescriptor),
+                    sf_field.default,
+                    sf_field.default_factory,
+                )
             )
-            if descriptor_alias and descriptor_alias in kwargs:
-                input_key = descriptor_alias
-
-            has_value = input_key in kwargs
-            if isinstance(sf_field.default, ObjectFieldDescriptor):
-                if not has_value:
-                    # if this field is under descriptor it has not an input value
-                    # -> send full kwargs dict into descriptor setter
-                    setattr(self, name, kwargs)
+        import_fields = tuple(import_fields_list)
+        _IMPORT_FIELDS_CACHE[cls] = import_fields
+    return import_fields
+
+
+# what ImportJsonMixin.__init__ assigns to a field missing from the input
+_FALLBACK_SKIP = 0
+_FALLBACK_KWARGS = 1
+_FALLBACK_FACTORY = 2
+_FALLBACK_DEFAULT = 3
+
+# how ImportJsonMixin.__init__ assigns a field value
+_ASSIGN_SETATTR = 0
+_ASSIGN_DESCRIPTOR = 1
+_ASSIGN_DICT = 2
+
+_IMPORT_PLAN_CACHE: WeakKeyDictionary[type, Tuple[tuple, ...]] = WeakKeyDictionary()
+
+
+def _get_import_plan(cls) -> Tuple[tuple, ...]:
+    """
+    Assignment plan used by ImportJsonMixin.__init__, built once per dataclass
+    from _get_import_fields(): (name, alias, fallback, fallback_value, assign, setter)
+    """
+    import_plan = _IMPORT_PLAN_CACHE.get(cls)
+    if import_plan is None:
+        custom_setattr = cls.__setattr__ is not object.__setattr__
+        import_plan_list = []
+        for (
+            name,
+            descriptor,
+            alias,
+            is_object_descriptor,
+            default,
+            default_factory,
+        ) in _get_import_fields(cls):
+            fallback_value = None
+            if is_object_descriptor:
+                # no own value: the descriptor builds the object from all kwargs
+                fallback = _FALLBACK_KWARGS
+            elif descriptor is not None:
+                fallback = _FALLBACK_SKIP
+            elif default_factory is not MISSING:
+                fallback, fallback_value = _FALLBACK_FACTORY, default_factory
+            elif default is not MISSING:
+                fallback, fallback_value = _FALLBACK_DEFAULT, default
+            else:
+                fallback = _FALLBACK_SKIP
+
+            # assignments skip setattr only when it would just reach the
+            # descriptor __set__ or the instance __dict__
+            setter = None
+            class_attribute = inspect.getattr_static(cls, name, None)
+            if custom_setattr:
+                assign = _ASSIGN_SETATTR
+            elif descriptor is not None:
+                if class_attribute is descriptor:
+                    assign, setter = _ASSIGN_DESCRIPTOR, descriptor.__set__
                 else:
-                    setattr(self, name, kwargs[input_key])
-                continue
+                    assign = _ASSIGN_SETATTR
+            elif hasattr(type(class_attribute), "__set__") or hasattr(
+                type(class_attribute), "__delete__"
+            ):
+                # properties, __slots__ members and other data descriptors
+                assign = _ASSIGN_SETATTR
+            else:
+                assign = _ASSIGN_DICT
+            import_plan_list.append(
+                (name, alias, fallback, fallback_value, assign, setter)
+            )
+        import_plan = tuple(import_plan_list)
+        _IMPORT_PLAN_CACHE[cls] = import_plan
+    return import_plan
+
+
+_REQUIRED_FIELDS_CACHE: WeakKeyDictionary[type, Tuple[tuple, ...]] = WeakKeyDictionary()
 
-            if has_value:
-                setattr(self, name, kwargs[input_key])
-                continue
 
+def _get_required_fields(cls) -> Tuple[tuple, ...]:
+    """
+    Required field metadata used by ImportJsonMixin.validate_required_fields,
+    built once per dataclass: (name, alias, object_descriptor)
+    object_descriptor is set for ObjectFieldDescriptor fields, it may be built
+    from flat input instead of its own key
+    """
+    required_fields = _REQUIRED_FIELDS_CACHE.get(cls)
+    if required_fields is None:
+        required_fields_list = []
+        for sf_field in fields(cls):
+            descriptor = (
+                sf_field.default
+                if isinstance(
+                    sf_field.default, (ObjectFieldDescriptor, FieldDescriptor)
+                )
+                else None
+            )
             if descriptor is not None:
+                if cls._is_descriptor_required(descriptor):
+                    required_fields_list.append(
+                        (
+                            sf_field.name,
+                            getattr(descriptor, "alias", None),
+                            (
+                                descriptor
+                                if isinstance(descriptor, ObjectFieldDescriptor)
+                                else None
+                            ),
+                        )
+                    )
                 continue
+            if sf_field.default is MISSING and sf_field.default_factory is MISSING:
+                required_fields_list.append((sf_field.name, None, None))
+        required_fields = tuple(required_fields_list)
+        _REQUIRED_FIELDS_CACHE[cls] = required_fields
+    return required_fields
+
+
+_FLAT_INPUT_KEYS_CACHE: WeakKeyDictionary[type, Tuple[str, ...]] = WeakKeyDictionary()
+
 
-            if sf_field.default_factory is not MISSING:
-                setattr(self, name, sf_field.default_factory())
+def _get_flat_input_keys(object_class) -> Tuple[str, ...]:
+    """
+    Input keys that let an object descriptor build object_class from flat input:
+    names and aliases of its fields and, recursively, of nested object fields
+    """
+    if not hasattr(object_class, "__dataclass_fields__"):
+        # also covers a missing object_class (None), which can't be a cache key
+        return ()
+    flat_input_keys = _FLAT_INPUT_KEYS_CACHE.get(object_class)
+    if flat_input_keys is None:
+        keys: Dict[str, None] = {}
+        visited = set()
+        pending = [object_class]
+        while pending:
+            current_class = pending.pop()
+            if current_class in visited or not hasattr(
+                current_class, "__dataclass_fields__"
+            ):
                 continue
+            visited.add(current_class)
+            try:
+                nested_fields = fields(current_class)
+            except TypeError:
+                continue
+            for nested_field in nested_fields:
+                keys[nested_field.name] = None
+                nested_descriptor = nested_field.default
+                if not isinstance(
+                    nested_descriptor, (ObjectFieldDescriptor, FieldDescriptor)
+                ):
+                    continue
+                nested_alias = getattr(nested_descriptor, "alias", None)
+                if nested_alias:
+                    keys[nested_alias] = None
+                if isinstance(nested_descriptor, ObjectFieldDescriptor):
+                    pending.append(getattr(nested_descriptor, "object_class", None))
+        flat_input_keys = tuple(keys)
+        _FLAT_INPUT_KEYS_CACHE[object_class] = flat_input_keys
+    return flat_input_keys
+
+
+# builtin value types exported as is (or as str() with stringify)
+_JSON_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _is_dataclass_type(cls) -> bool:
+    """is_dataclass() for the type of an exported value, without its instance check"""
+    return hasattr(cls, "__dataclass_fields__")
+
+
+_EXPORT_FIELDS_CACHE: WeakKeyDictionary[type, Tuple[Tuple[str, str], ...]] = (
+    WeakKeyDictionary()
+)
+
+
+def _get_export_fields(cls) -> Tuple[Tuple[str, str], ...]:
+    """
+    Field names used by the exporters, built once per dataclass:
+    (name, alias), alias is the descriptor alias or the field name itself
+    """
+    export_fields = _EXPORT_FIELDS_CACHE.get(cls)
+    if export_fields is None:
+        export_fields_list = []
+        for sf_field in fields(cls):
+            # class attribute lookup returns the descriptor itself
+            descriptor = getattr(cls, sf_field.name, None)
+            alias = (
+                getattr(descriptor, "alias", None) if descriptor is not None else None
+            )
+            export_fields_list.append((sf_field.name, alias or sf_field.name))
+        export_fields = tuple(export_fields_list)
+        _EXPORT_FIELDS_CACHE[cls] = export_fields
+    return export_fields
+
+
+# class -> {(use_alias, stringify): builder}
+_EXPORT_BUILDERS_CACHE: WeakKeyDictionary[type, Dict[Tuple[bool, bool], Callable]] = (
+    WeakKeyDictionary()
+)
 
-            if sf_field.default is not MISSING:
-                setattr(self, name, sf_field.default)
+
+def _get_export_builder(cls, use_alias: bool, stringify: bool) -> Callable:
+    """
+    Generated function that exports one dataclass instance to a dict,
+    with the field reads and keys of cls written out:
+
+        def export(obj, convert):
+            value_0 = obj.name
+            ...
+            return {"key": value_0 if type(value_0) in scalar_types else convert(value_0), ...}
+
+    Exact builtin scalars are written as is (through str() with stringify),
+    without a call to convert; the check is done on the runtime value
+    """
+    use_alias = bool(use_alias)
+    stringify = stringify is True
+    class_builders = _EXPORT_BUILDERS_CACHE.get(cls)
+    if class_builders is None:
+        class_builders = _EXPORT_BUILDERS_CACHE[cls] = {}
+    builder = class_builders.get((use_alias, stringify))
+    if builder is None:
+        scalar_template = "str({0})" if stringify else "{0}"
+        reads = ["def export(obj, convert):"]
+        items = ["    return {"]
+        for index, (name, alias) in enumerate(_get_export_fields(cls)):
+            export_key = alias if use_alias else name
+            value = f"value_{index}"
+            reads.append(f"    {value} = obj.{name}")
+            items.append(
+                f"        {export_key!r}: {scalar_template.format(value)}"
+                f" if type({value}) in scalar_types else convert({value}),"
+            )
+        items.append("    }")
+        namespace: Dict[str, Any] = {"scalar_types": _JSON_SCALAR_TYPES}
+        exec(
+            compile("\n".join(reads + items), f"<export {cls.__qualname__}>", "exec"),
+            namespace,
+        )
+        builder = namespace["export"]
+        class_builders[(use_alias, stringify)] = builder
+    return builder
+
+
+@dataclass
+class ImportJsonMixin:
+    """
+    Add support for importing a dict object with any keys,
+    even if they are not expected in the current dataclass.
+    Only the fields defined in the dataclass will be used.
+    """
+
+    def __init__(self, **kwargs):
+        self.validate_required_fields(kwargs)
+        instance_dict = getattr(self, "__dict__", None)
+        for (
+            name,
+            descriptor_alias,
+            fallback,
+            fallback_value,
+            assign,
+            setter,
+        ) in _get_import_plan(type(self)):
+            if descriptor_alias and descriptor_alias in kwargs:
+                value = kwargs[descriptor_alias]
+            elif name in kwargs:
+                value = kwargs[name]
+            elif fallback == _FALLBACK_SKIP:
+                continue
+            elif fallback == _FALLBACK_KWARGS:
+                # if this field is under descriptor it has not an input value
+                # -> send full kwargs dict into descriptor setter
+                value = kwargs
+            elif fallback == _FALLBACK_FACTORY:
+                value = fallback_value()
+            else:
+                value = fallback_value
+
+            if assign == _ASSIGN_DESCRIPTOR:
+                setter(self, value)
+            elif assign == _ASSIGN_DICT and instance_dict is not None:
+                instance_dict[name] = value
+            else:
+                setattr(self, name, value)
 
     @staticmethod
     def _is_descriptor_required(descriptor: Any) -> bool:
@@ -81,47 +346,11 @@ class ImportJsonMixin:
     def _object_descriptor_can_be_built_from_flat_input(
         cls, descriptor: Any, input_data: Dict[str, Any]
     ) -> bool:
-        object_class = getattr(descriptor, "object_class", None)
-        if object_class is None or not hasattr(object_class, "__dataclass_fields__"):
-            return False
-
-        try:
-            nested_fields = fields(object_class)
-        except TypeError:
-            return False
-
-        for nested_field in nested_fields:
-            nested_descriptor = (
-                nested_field.default
-                if isinstance(
-                    nested_field.default, (ObjectFieldDescriptor, FieldDescriptor)
-                )
-                else None
-            )
-
-            nested_alias = (
-                getattr(nested_descriptor, "alias", None)
-                if nested_descriptor is not None
-                else None
-            )
-            nested_has_value = nested_field.name in input_data or (
-                nested_alias in input_data if nested_alias else False
-            )
-
-            if nested_descriptor is not None and isinstance(
-                nested_descriptor, ObjectFieldDescriptor
-            ):
-                if nested_has_value:
-                    return True
-                if cls._object_descriptor_can_be_built_from_flat_input(
-                    nested_descriptor, input_data
-                ):
-                    return True
-                continue
-
-            if nested_has_value:
+        for input_key in _get_flat_input_keys(
+            getattr(descriptor, "object_class", None)
+        ):
+            if input_key in input_data:
                 return True
-
         return False
 
     def validate_required_fields(self, input_data: Dict[str, Any]):
@@ -129,39 +358,21 @@ class ImportJsonMixin:
         Validates that all required fields are present in the input data.
         Raises an exception if any required field is missing.
         """
-        missing_fields = []
-        for field_obj in fields(self):
-            descriptor = (
-                field_obj.default
-                if isinstance(
-                    field_obj.default, (ObjectFieldDescriptor, FieldDescriptor)
+        missing_fields = None
+        for name, alias, object_descriptor in _get_required_fields(type(self)):
+            if name in input_data or (alias and alias in input_data):
+                continue
+            if (
+                object_descriptor is not None
+                and self._object_descriptor_can_be_built_from_flat_input(
+                    object_descriptor, input_data
                 )
-                else None
-            )
-
-            if descriptor is not None:
-                is_required = self._is_descriptor_required(descriptor)
-                if is_required:
-                    descriptor_alias = getattr(descriptor, "alias", None)
-                    has_value = field_obj.name in input_data or (
-                        descriptor_alias in input_data if descriptor_alias else False
-                    )
-                    if (
-                        not has_value
-                        and isinstance(descriptor, ObjectFieldDescriptor)
-                        and self._object_descriptor_can_be_built_from_flat_input(
-                            descriptor, input_data
-                        )
-                    ):
-                        has_value = True
-                    if not has_value:
-                        missing_fields.append(field_obj.name)
+            ):
                 continue
-
-            has_default = field_obj.default is not MISSING
-            has_factory = field_obj.default_factory is not MISSING
-            if not has_default and not has_factory and field_obj.name not in input_data:
-                missing_fields.append(field_obj.name)
+            # allocated only when something is missing
+            if missing_fields is None:
+                missing_fields = []
+            missing_fields.append(name)
         if missing_fields:
             raise MissingRequiredFieldsError(
                 f"missing required fields with no default values: {', '.join(missing_fields)}\ninput_data: {input_data}"
@@ -177,18 +388,100 @@ class ImportJsonMixin:
             True if there is at least one required field; otherwise False.
         """
         try:
-            dc_fields = fields(cls)
+            import_fields = _get_import_fields(cls)
         except TypeError:
             # Not a dataclass type; by contract, treat as having no required fields
             return False
-        for field_obj in dc_fields:
-            has_default = field_obj.default is not MISSING
-            has_factory = field_obj.default_factory is not MISSING
-            if not has_default and not has_factory:
+        for *_, default, default_factory in import_fields:
+            if default is MISSING and default_factory is MISSING:
                 return True
         return False
 
 
+def _build_fast_init(cls) -> Callable:
+    """
+    Generate an __init__ for an ImportJsonMixin dataclass from the import plan,
+    with the per-field branches of ImportJsonMixin.__init__ resolved once
+    for the class.
+    """
+    namespace: Dict[str, Any] = {
+        "_cls": cls,
+        "_import_init": ImportJsonMixin.__init__,
+    }
+    lines: List[str] = [
+        "def __init__(self, **kwargs):",
+        # subclasses have fields of their own, they use the generic import
+        "    if type(self) is not _cls:",
+        "        _import_init(self, **kwargs)",
+        "        return",
+    ]
+    if (
+        _get_required_fields(cls)
+        or cls.validate_required_fields is not ImportJsonMixin.validate_required_fields
+    ):
+        # nothing to validate for classes without required fields
+        lines.append("    self.validate_required_fields(kwargs)")
+    import_plan = _get_import_plan(cls)
+    if any(assign == _ASSIGN_DICT for *_, assign, _ in import_plan):
+        lines.append("    instance_dict = self.__dict__")
+    for index, (name, alias, fallback, fallback_value, assign, setter) in enumerate(
+        import_plan
+    ):
+        if assign == _ASSIGN_DESCRIPTOR:
+            namespace[f"_set_{index}"] = setter
+            target = f"_set_{index}(self, {{}})"
+        elif assign == _ASSIGN_DICT:
+            target = f"instance_dict[{name!r}] = {{}}"
+        else:
+            target = f"setattr(self, {name!r}, {{}})"
+
+        keyword = "if"
+        for input_key in (alias, name) if alias else (name,):
+            lines.append(f"    {keyword} {input_key!r} in kwargs:")
+            lines.append("        " + target.format(f"kwargs[{input_key!r}]"))
+            keyword = "elif"
+        if fallback == _FALLBACK_SKIP:
+            continue
+        if fallback == _FALLBACK_KWARGS:
+            value = "kwargs"
+        elif fallback == _FALLBACK_FACTORY:
+            namespace[f"_fallback_{index}"] = fallback_value
+            value = f"_fallback_{index}()"
+        else:
+            namespace[f"_fallback_{index}"] = fallback_value
+            value = f"_fallback_{index}"
+        lines.append("    else:")
+        lines.append("        " + target.format(value))
+
+    exec(
+        compile("\n".join(lines), f"<fast_init {cls.__qualname__}>", "exec"), namespace
+    )
+    init = namespace["__init__"]
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    init.__module__ = cls.__module__
+    init.__doc__ = ImportJsonMixin.__init__.__doc__
+    return init
+
+
+def fast_init(cls):
+    """
+    Opt-in class decorator for ImportJsonMixin dataclasses.
+    Replaces __init__ with code generated for the class fields, it imports data
+    the same way ImportJsonMixin.__init__ does, without the per-field dispatch.
+    Instances of subclasses are imported by ImportJsonMixin.__init__.
+    Apply it above @dataclass:
+
+        @fast_init
+        @dataclass
+        class Model(ImportJsonMixin):
+            ...
+    """
+    if not issubclass(cls, ImportJsonMixin):
+        raise TypeError(f"{cls.__name__} must inherit ImportJsonMixin to use fast_init")
+    cls.__init__ = _build_fast_init(cls)
+    return cls
+
+
 @dataclass
 class ExportJsonMixin:
     """
@@ -206,6 +499,7 @@ class ExportJsonMixin:
         Returns:
             A JSON-serializable representation of the dataclass
         """
+        instance_type = type(self)
 
         def recursive_to_json(obj):
             """
@@ -218,34 +512,26 @@ class ExportJsonMixin:
                 A JSON-serializable representation of the object
             """
             obj_type = type(obj)
-            instance_type = type(self)
-            if (
-                hasattr(obj, "to_json")
-                and not obj_type == instance_type
-                and callable(obj.to_json)
-            ):
+            # exact builtin containers and scalars have no to_json and are not
+            # dataclasses, so they skip the generic checks below
+            if obj_type is list:
+                return [recursive_to_json(item) for item in obj]
+            if obj_type is dict:
+                return {key: recursive_to_json(value) for key, value in obj.items()}
+            if obj_type in _JSON_SCALAR_TYPES:
+                return str(obj) if stringify is True else obj
+            # one lookup instead of hasattr() plus two attribute reads
+            to_json = (
+                getattr(obj, "to_json", None) if obj_type != instance_type else None
+            )
+            if to_json is not None and callable(to_json):
                 # Use custom to_json method
                 # NOTE: to use specified export implement "to_json/0" instance method
-                return obj.to_json(stringify=stringify)
-            elif is_dataclass(obj):
-                result = {}
-                for field in fields(obj):
-                    field_value = getattr(obj, field.name)
-
-                    # Определяем ключ для экспорта
-                    export_key = field.name
-                    if use_alias:
-                        # Получаем дескриптор через класс
-                        descriptor = getattr(type(obj), field.name, None)
-                        if (
-                            descriptor is not None
-                            and hasattr(descriptor, "alias")
-                            and descriptor.alias
-                        ):
-                            export_key = descriptor.alias
-
-                    result[export_key] = recursive_to_json(field_value)
-                return result
+                return to_json(stringify=stringify)
+            elif _is_dataclass_type(obj_type):
+                return _get_export_builder(obj_type, use_alias, stringify)(
+                    obj, recursive_to_json
+                )
             elif isinstance(obj, list):
                 return [recursive_to_json(item) for item in obj]
             elif isinstance(obj, dict):
@@ -275,82 +561,87 @@ class FlatExportJsonMixin:
             A flat JSON-serializable representation of the dataclass
         """
 
+        flat_dict = {}
+        instance_type = type(self)
+
         def recursive_to_json(obj, prefix=""):
             """
-            Recursively flatten an object into a dict with dot-separated keys.
+            Recursively flatten an object into the shared flat_dict
+            with dot-separated keys.
 
             Args:
                 obj: The object to convert
                 prefix: The current key prefix for nested fields
-
-            Returns:
-                A flat dictionary of key-value pairs
             """
-            flat_dict = {}
-
-            if (
-                hasattr(obj, "to_json")
-                and callable(obj.to_json)
-                and not isinstance(obj, type(self))
-            ):
+            if type(obj) in _JSON_SCALAR_TYPES:
+                # exact builtin scalars are leaves, skip the generic checks below
+                flat_dict[prefix.rstrip(".")] = str(obj) if stringify else obj
+                return
+
+            # one lookup instead of hasattr() plus two attribute reads
+            to_json = (
+                getattr(obj, "to_json", None)
+                if not isinstance(obj, instance_type)
+                else None
+            )
+            if to_json is not None and callable(to_json):
                 # if another dataclass has its own exporter
-                nested = obj.to_json(stringify=stringify)
+                nested = to_json(stringify=stringify)
                 # if nested export is also flat — merge directly
                 if isinstance(nested, dict):
-                    for k, v in nested.items():
-                        if use_prefix:
-                            key = f"{prefix}{k}" if not prefix else f"{prefix}.{k}"
-                        else:
-                            key = k
-                        flat_dict[key] = v
+                    if use_prefix:
+                        for k, v in nested.items():
+                            flat_dict[f"{prefix}.{k}" if prefix else f"{k}"] = v
+                    else:
+                        flat_dict.update(nested)
                 else:
                     flat_dict[prefix.rstrip(".")] = nested
 
-            elif is_dataclass(obj):
-                for field in fields(obj):
-                    value = getattr(obj, field.name)
-
+            elif _is_dataclass_type(type(obj)):
+                # here and below scalar children are written in place when
+                # prefixes are used, saving a recursive call per leaf
+                for name, alias in _get_export_fields(type(obj)):
+                    value = getattr(obj, name)
+                    if not use_prefix:
+                        recursive_to_json(value, None)
+                        continue
                     # Определяем имя поля для экспорта
-                    field_name = field.name
-                    if use_alias:
-                        descriptor = getattr(type(obj), field.name, None)
-                        if (
-                            descriptor is not None
-                            and hasattr(descriptor, "alias")
-                            and descriptor.alias
-                        ):
-                            field_name = descriptor.alias
-
-                    if use_prefix:
-                        new_prefix = (
-                            f"{prefix}{field_name}"
-                            if not prefix
-                            else f"{prefix}.{field_name}"
+                    field_name = alias if use_alias else name
+                    new_prefix = f"{prefix}.{field_name}" if prefix else field_name
+                    if type(value) in _JSON_SCALAR_TYPES:
+                        flat_dict[new_prefix.rstrip(".")] = (
+                            str(value) if stringify else value
                         )
                     else:
-                        new_prefix = None
-                    flat_dict.update(recursive_to_json(value, new_prefix))
+                        recursive_to_json(value, new_prefix)
 
             elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    if use_prefix:
-                        new_prefix = f"{prefix}[{i}]"
-                    else:
-                        new_prefix = None
-                    flat_dict.update(recursive_to_json(item, new_prefix))
+                if not use_prefix:
+                    for item in obj:
+                        recursive_to_json(item, None)
+                else:
+                    for i, item in enumerate(obj):
+                        if type(item) in _JSON_SCALAR_TYPES:
+                            flat_dict[f"{prefix}[{i}]"] = (
+                                str(item) if stringify else item
+                            )
+                        else:
+                            recursive_to_json(item, f"{prefix}[{i}]")
 
             elif isinstance(obj, dict):
                 for k, v in obj.items():
-                    if use_prefix:
-                        new_prefix = f"{prefix}.{k}" if prefix else str(k)
+                    if not use_prefix:
+                        recursive_to_json(v, None)
+                        continue
+                    new_prefix = f"{prefix}.{k}" if prefix else str(k)
+                    if type(v) in _JSON_SCALAR_TYPES:
+                        flat_dict[new_prefix.rstrip(".")] = str(v) if stringify else v
                     else:
-                        new_prefix = None
-                    flat_dict.update(recursive_to_json(v, new_prefix))
+                        recursive_to_json(v, new_prefix)
 
             else:
                 key = prefix.rstrip(".")
                 flat_dict[key] = str(obj) if stringify else obj
 
-            return flat_dict
-
-        return recursive_to_json(self)
+        recursive_to_json(self)
+        return flat_dict
@@ -1,9 +1,12 @@
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+import copy
+import pickle
 import uuid
 
 import pytest
 
 from descriptors import (
+    COMMON_DATE_TIME_FORMAT,
     BoolToIntDescriptor,
     DateTimeDescriptor,
     DateTimeWrapper,
@@ -154,6 +157,28 @@ def test_datetime_descriptor_parses_formats_and_wraps_on_get():
     assert str(wrapped) == "2024-01-02"
 
 
+def test_datetime_wrapper_common_format_matches_strftime():
+    for value in (
+        datetime(2024, 1, 2, 3, 4, 5),
+        datetime(2024, 1, 2, 3, 4, 5, 678),
+        datetime(999, 12, 31, 23, 59, 59),
+    ):
+        wrapped = DateTimeWrapper(value, COMMON_DATE_TIME_FORMAT)
+        assert str(wrapped) == value.strftime(COMMON_DATE_TIME_FORMAT)
+
+
+def test_datetime_wrapper_strftime_keeps_timezone_of_equal_aware_values():
+    utc_value = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    shifted_value = utc_value.astimezone(timezone(timedelta(hours=3)))
+    assert utc_value == shifted_value
+
+    dt_format = "%Y-%m-%dT%H:%M:%S%z"
+    assert DateTimeWrapper(utc_value, dt_format).strftime(dt_format) == (
+        "2024-01-02T03:04:05+0000"
+    )
+    assert str(DateTimeWrapper(shifted_value, dt_format)) == "2024-01-02T06:04:05+0300"
+
+
 def test_datetime_descriptor_parses_timestamp_string_and_invalid_uses_default():
     obj = DateTimeHolder()
     obj.value = "1700000000"
@@ -207,6 +232,12 @@ def test_float_string_descriptor_coercion_and_default_fallback():
     obj.value = "bad"
     assert obj.value == 1.25
 
+    obj.value = True
+    assert obj.value == 1.0 and type(obj.value) is float
+
+    obj.value = [2.5]
+    assert obj.value == 1.25
+
 
 def test_float_string_descriptor_without_default_raises_on_get_and_invalid_set():
     obj = FloatNoDefaultHolder()
@@ -231,6 +262,53 @@ def test_int_string_descriptor_coercion_and_default_fallback():
     assert obj.value == 3
 
 
+def test_numeric_string_descriptors_accept_float_syntax_and_reject_the_rest():
+    float_obj = FloatHolder()
+    int_obj = IntHolder()
+    for text, float_value, int_value in (
+        (" 1_000 ", 1000.0, 1000),
+        ("-1.5e2", -150.0, -150),
+        (".5", 0.5, 0),
+        ("12345678901234567891", 12345678901234567891.0, 12345678901234567891),
+    ):
+        float_obj.value = text
+        int_obj.value = text
+        assert float_obj.value == float_value
+        assert int_obj.value == int_value
+
+    float_obj.value = "-inf"
+    assert float_obj.value == float("-inf")
+    float_obj.value = "iNfInItY"
+    assert float_obj.value == float("inf")
+
+    # non-ASCII letters that case-fold to "i" are rejected by float() as well
+    for text in ("İnf", "ınf", "infİnity", "infınity"):
+        float_obj.value = text
+        int_obj.value = text
+        assert float_obj.value == 1.25
+        assert int_obj.value == 3
+
+    for text in ("", "1.2.3", "1e", "_1", "nan"):
+        int_obj.value = text
+        assert int_obj.value == 3
+
+
+def test_numeric_string_descriptors_match_int_and_float_whitespace_rules():
+    float_obj = FloatHolder()
+    int_obj = IntHolder()
+    # \x1c-\x1f are whitespace for str.isspace(), but int()/float() reject them
+    for text in ("7\x1c", "\x1f7", "7.5\x1d"):
+        float_obj.value = text
+        int_obj.value = text
+        assert float_obj.value == 1.25
+        assert int_obj.value == 3
+
+    float_obj.value = "\xa07.5\u2003"
+    int_obj.value = "\xa07\u2003"
+    assert float_obj.value == 7.5
+    assert int_obj.value == 7
+
+
 def test_int_string_descriptor_without_default_raises_on_get_and_invalid_set():
     obj = IntNoDefaultHolder()
     with pytest.raises(ValueError):
@@ -266,9 +344,20 @@ def test_int_string_to_bool_descriptor_invalid_string_uses_default_factory_value
     assert obj.value is True
 
 
+def test_int_string_to_bool_descriptor_rejects_separator_characters():
+    obj = IntToBoolHolder()
+    obj.value = "0"
+    obj.value = "1\x1c"
+    assert obj.value is True
+
+    obj.value = " 0 "
+    assert obj.value is False
+
+
 def test_single_object_descriptor_optional_defaults_to_none_and_dict_coercion():
     obj = SingleObjectOptionalHolder()
     assert obj.value is None
+    assert "value" not in obj.__dict__
 
     obj.value = {"name": "mapped"}
     assert isinstance(obj.value, ChildObject)
@@ -397,6 +486,17 @@ def test_list_of_int_descriptor_coercion_and_default_fallback():
     assert obj.value == [1, 2]
 
 
+def test_list_of_int_descriptor_skips_items_int_rejects():
+    obj = ListOfIntHolder()
+    obj.value = ["3\x1f", "\x1c4", " 5 ", "6"]
+    assert obj.value == [5, 6]
+
+    class DefaultHolder:
+        value = ListOfIntDescriptor(default=["1\x1e", 2])
+
+    assert DefaultHolder().value == [2]
+
+
 def test_list_of_int_descriptor_without_default_raises_on_get_and_non_list_set():
     obj = ListOfIntNoDefaultHolder()
     with pytest.raises(ValueError):
@@ -415,7 +515,164 @@ def test_list_of_uuid_descriptor_coercion_and_invalid_skip():
     assert obj.value == [valid_2, DEFAULT_UUID]
 
 
+def test_list_of_uuid_descriptor_keeps_uuid_subclass_instances():
+    class TaggedUuid(uuid.UUID):
+        pass
+
+    tagged = TaggedUuid("bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb")
+    obj = ListOfUuidHolder()
+
+    obj.value = [tagged, str(DEFAULT_UUID)]
+    assert obj.value == [tagged, DEFAULT_UUID]
+    assert obj.value[0] is tagged
+
+    obj.value = [tagged, "bad"]
+    assert obj.value[0] is tagged
+
+
 def test_list_of_uuid_descriptor_raise_on_error_for_invalid_item():
     obj = ListOfUuidRaiseHolder()
     with pytest.raises(Exception, match="Invalid UUID value"):
         obj.value = ["bad"]
+
+
+def test_object_descriptors_accept_subclasses_of_expected_input_types():
+    class ChildSubclass(ChildObject):
+        pass
+
+    class DictSubclass(dict):
+        pass
+
+    single = SingleObjectDefaultHolder()
+    sub_child = ChildSubclass(name="sub")
+    single.value = sub_child
+    assert single.value is sub_child
+
+    single.value = DictSubclass(name="from-subclass")
+    assert single.value.name == "from-subclass"
+
+    object_list = ObjectListHolder()
+
+    class ListSubclass(list):
+        pass
+
+    object_list.value = ListSubclass([{"name": "first"}])
+    assert [item.name for item in object_list.value] == ["first"]
+
+    object_map = MapObjectHolder()
+    object_map.value = DictSubclass(a={"name": "mapped"})
+    assert object_map.value["a"].name == "mapped"
+
+
+def test_str_uuid_descriptor_accepts_all_stdlib_string_forms():
+    obj = UuidHolder()
+    text = str(DEFAULT_UUID)
+
+    for form in (text.upper(), "{" + text + "}", text.replace("-", "")):
+        obj.value = "aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"
+        obj.value = form
+        assert obj.value == DEFAULT_UUID
+        assert type(obj.value) is uuid.UUID
+
+
+class ObjectListDefaultHolder:
+    value = ObjectListDescriptor(ChildObject, default=[ChildObject(name="shared")])
+
+
+class MapObjectDefaultHolder:
+    value = MapObjectDescriptor(ChildObject, default={"a": ChildObject(name="shared")})
+
+
+def test_object_list_and_map_defaults_are_per_instance_and_kept_on_read():
+    first, second = ObjectListHolder(), ObjectListHolder()
+    first.value.append(ChildObject(name="added"))
+    assert [item.name for item in first.value] == ["added"]
+    assert second.value == []
+
+    first, second = ObjectListDefaultHolder(), ObjectListDefaultHolder()
+    first.value.append(ChildObject(name="added"))
+    assert [item.name for item in first.value] == ["shared", "added"]
+    assert [item.name for item in second.value] == ["shared"]
+
+    first, second = MapObjectDefaultHolder(), MapObjectDefaultHolder()
+    first.value["b"] = ChildObject(name="added")
+    assert set(first.value) == {"a", "b"}
+    assert set(second.value) == {"a"}
+
+
+def test_single_object_descriptor_without_has_required_fields_builds_empty_object():
+    class PlainChild:
+        def __init__(self, name="plain"):
+            self.name = name
+
+    class PlainHolder:
+        value = SingleObjectDescriptor(PlainChild, optional=False)
+
+    assert PlainHolder().value.name == "plain"
+
+
+def test_datetime_descriptor_tries_formats_in_declared_order():
+    obj = DateTimeHolder()
+    obj.value = "20240101T101010"
+    assert obj.value.to_json() == datetime(2024, 1, 1, 10, 10, 10)
+
+    # also matches "%Y%m%dT%H%M", the earlier "%Y%m%dT%H%M%S" entry wins
+    for _ in range(2):
+        obj.value = "20240101T1010"
+        assert obj.value.to_json() == datetime(2024, 1, 1, 10, 1, 0)
+
+
+def test_datetime_descriptor_fixed_width_forms_match_strptime():
+    obj = DateTimeHolder()
+    for text, date_format in (
+        ("2024-02-29T23:59:59", "%Y-%m-%dT%H:%M:%S"),
+        ("20240229T235959", "%Y%m%dT%H%M%S"),
+    ):
+        obj.value = text
+        assert obj.value.to_json() == datetime.strptime(text, date_format)
+
+    # out of range parts fall back to the default like strptime failures
+    for text in ("2023-02-29T00:00:00", "20240101T250000", "2024-01-01T10:10:1x"):
+        obj.value = text
+        assert obj.value.to_json() == datetime(2000, 1, 1, 0, 0, 0)
+
+
+def test_datetime_descriptor_calls_default_factory_only_for_fallback():
+    calls = []
+
+    def default_factory():
+        calls.append(1)
+        return datetime(2000, 1, 1)
+
+    class CountingHolder:
+        value = DateTimeDescriptor(default_factory=default_factory)
+
+    obj = CountingHolder()
+    obj.value = "2024-01-02T03:04:05"
+    obj.value = 1700000000
+    assert calls == []
+
+    obj.value = ""
+    assert obj.value.to_json() == datetime(2000, 1, 1)
+    assert calls == [1]
+
+
+def test_datetime_descriptor_wraps_once_and_accepts_wrapped_values():
+    source = DateTimeHolder()
+    source.value = "2024-01-02T03:04:05"
+    assert source.value is source.value
+
+    target = DateTimeHolder()
+    target.value = source.value
+    assert target.value.to_json() == datetime(2024, 1, 2, 3, 4, 5)
+
+
+def test_datetime_field_survives_deepcopy_and_pickle():
+    source = DateTimeHolder()
+    source.value = "2024-01-02T03:04:05"
+
+    for restored in (copy.deepcopy(source), pickle.loads(pickle.dumps(source))):
+        assert isinstance(restored.value, DateTimeWrapper)
+        assert restored.value.to_json() == datetime(2024, 1, 2, 3, 4, 5)
+        assert str(restored.value) == "2024-01-02"
+        assert restored.value.year == 2024
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any
 
 from descriptors import (
     DateTimeDescriptor,
@@ -98,6 +98,71 @@ class NestedRootExport(ImportJsonMixin):
     to_json = ExportJsonMixin.to_json
 
 
+@dataclass
+class LeafOnlyExport(ExportJsonMixin):
+    count: int = 3
+    ratio: float = 0.5
+    enabled: bool = True
+    title: str = "leaf"
+
+
+@dataclass
+class LeafOnlyParentExport(ExportJsonMixin):
+    leaves: list = field(default_factory=lambda: [LeafOnlyExport()])
+
+
+def test_export_leaf_only_dataclass() -> None:
+    leaf = LeafOnlyExport()
+
+    assert leaf.to_json() == {
+        "count": 3,
+        "ratio": 0.5,
+        "enabled": True,
+        "title": "leaf",
+    }
+    assert leaf.to_json(stringify=True) == {
+        "count": "3",
+        "ratio": "0.5",
+        "enabled": "True",
+        "title": "leaf",
+    }
+    assert LeafOnlyParentExport().to_json(stringify=True) == {
+        "leaves": [leaf.to_json(stringify=True)]
+    }
+
+
+@dataclass
+class MismatchedAnnotationExport(ExportJsonMixin):
+    count: int = 0
+
+
+@dataclass
+class UnhashableAnnotationExport(ExportJsonMixin):
+    timeout: Annotated[int, {"unit": "ms"}] = 5
+
+
+def test_export_converts_by_runtime_value_not_annotation() -> None:
+    model = MismatchedAnnotationExport(count=[LeafOnlyExport(count=1)])
+
+    assert model.to_json() == {
+        "count": [
+            {"count": 1, "ratio": 0.5, "enabled": True, "title": "leaf"},
+        ],
+    }
+    assert model.to_json(stringify=True) == {
+        "count": [
+            {"count": "1", "ratio": "0.5", "enabled": "True", "title": "leaf"},
+        ],
+    }
+
+
+def test_export_with_unhashable_annotation() -> None:
+    model = UnhashableAnnotationExport()
+
+    assert model.to_json() == {"timeout": 5}
+    assert model.to_json(stringify=True) == {"timeout": "5"}
+
+
 def test_export_alias_keys_when_enabled() -> None:
     model = AliasExportModel(foo="103", **{"@foo": "102"})
 
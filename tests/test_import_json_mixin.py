@@ -1,5 +1,7 @@
+import gc
+import weakref
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Dict
 
 import pytest
 
@@ -10,7 +12,13 @@ from descriptors import (
     ObjectListDescriptor,
     SingleObjectDescriptor,
 )
-from mixins import ImportJsonMixin, MissingRequiredFieldsError
+from mixins import (
+    ExportJsonMixin,
+    FlatExportJsonMixin,
+    ImportJsonMixin,
+    MissingRequiredFieldsError,
+    fast_init,
+)
 
 
 @dataclass
@@ -102,6 +110,20 @@ class NestedRootImport(ImportJsonMixin):
         ImportJsonMixin.__init__(self, **kwargs)
 
 
+@fast_init
+@dataclass
+class FastInitModel(ImportJsonMixin):
+    required_name: str
+    nested_middle: Any = field(
+        default=SingleObjectDescriptor(NestedMiddleImport, optional=False)
+    )
+    a_foo: Any = field(
+        default=IntStringDescriptor(default_factory=lambda: None, alias="@foo")
+    )
+    tags: list = field(default_factory=list)
+    root_name: str = "root"
+
+
 def test_required_field_validation_raises_on_missing_field() -> None:
     error: Any = None
     try:
@@ -189,3 +211,166 @@ def test_single_object_descriptor_supports_flat_input_for_nested_models() -> Non
 
     assert model.root_name == "flat"
     assert model.nested_middle.nested_leaf.leaf_value == 15
+
+
+def test_fast_init_imports_like_import_json_mixin() -> None:
+    model = FastInitModel(
+        leaf_value="15", required_name="fast", ignored="x", **{"@foo": "7"}
+    )
+
+    assert model.nested_middle.nested_leaf.leaf_value == 15
+    assert model.a_foo == 7
+    assert model.required_name == "fast"
+    assert model.tags == []
+    assert model.root_name == "root"
+    assert not hasattr(model, "ignored")
+    assert FastInitModel(required_name="a", leaf_value="1").tags is not model.tags
+
+
+def test_fast_init_validates_required_fields() -> None:
+    with pytest.raises(MissingRequiredFieldsError) as exc_info:
+        FastInitModel(leaf_value="1")
+
+    assert "required_name" in str(exc_info.value)
+
+
+def test_fast_init_subclass_imports_its_own_fields() -> None:
+    @fast_init
+    @dataclass
+    class BaseModel(ImportJsonMixin):
+        a: Any = field(default=IntStringDescriptor(default=0))
+
+    @dataclass
+    class ChildModel(BaseModel):
+        b: Any = field(default=IntStringDescriptor(default=0))
+        name: str = ""
+
+        def __init__(self, **kwargs: Any) -> None:
+            super().__init__(**kwargs)
+
+    model = ChildModel(a="1", b="2", name="x")
+
+    assert vars(model) == {"a": 1, "b": 2, "name": "x"}
+    assert vars(BaseModel(a="3", b="4")) == {"a": 3}
+
+
+def test_fast_init_subclass_validates_its_required_fields() -> None:
+    @fast_init
+    @dataclass
+    class OptionalBase(ImportJsonMixin):
+        value: Any = field(default=IntStringDescriptor(default=0))
+
+    @dataclass
+    class RequiredChild(OptionalBase):
+        code: str = field(kw_only=True)
+
+        def __init__(self, **kwargs: Any) -> None:
+            super().__init__(**kwargs)
+
+    with pytest.raises(MissingRequiredFieldsError) as exc_info:
+        RequiredChild(value="1")
+
+    assert "code" in str(exc_info.value)
+    assert RequiredChild(value="1", code="x").code == "x"
+    assert OptionalBase().value == 0
+
+
+def test_fast_init_requires_import_json_mixin() -> None:
+    @dataclass
+    class Plain:
+        value: int = 0
+
+    with pytest.raises(TypeError):
+        fast_init(Plain)
+
+
+def test_fast_init_keeps_overridden_validation_without_required_fields() -> None:
+    @fast_init
+    @dataclass
+    class CheckedModel(ImportJsonMixin):
+        value: Any = field(default=IntStringDescriptor(default=0))
+
+        def validate_required_fields(self, input_data: Dict[str, Any]) -> None:
+            if "forbidden" in input_data:
+                raise MissingRequiredFieldsError("forbidden")
+
+    assert CheckedModel(value="3").value == 3
+    with pytest.raises(MissingRequiredFieldsError):
+        CheckedModel(forbidden=True)
+
+
+def test_import_keeps_custom_setattr_for_every_field() -> None:
+    @dataclass
+    class TrackedModel(ImportJsonMixin):
+        value: Any = field(default=IntStringDescriptor(default=0))
+        name: str = ""
+        tags: list = field(default_factory=list)
+
+        def __init__(self, **kwargs: Any) -> None:
+            ImportJsonMixin.__init__(self, **kwargs)
+
+        def __setattr__(self, name: str, value: Any) -> None:
+            assigned.append(name)
+            super().__setattr__(name, value)
+
+    assigned: list = []
+    model = TrackedModel(value="5", name="tracked")
+
+    assert assigned == ["value", "name", "tags"]
+    assert model.value == 5
+    assert model.name == "tracked"
+    assert model.tags == []
+
+
+def test_import_into_slots_dataclass() -> None:
+    @dataclass(slots=True)
+    class SlotsModel(ImportJsonMixin):
+        name: str
+        tags: list = field(default_factory=list)
+        count: int = 0
+
+        def __init__(self, **kwargs: Any) -> None:
+            ImportJsonMixin.__init__(self, **kwargs)
+
+    model = SlotsModel(name="slots", count=2, ignored=True)
+
+    assert model.name == "slots"
+    assert model.tags == []
+    assert model.count == 2
+    assert "name" not in vars(model)
+
+
+def test_per_class_caches_do_not_keep_classes_alive() -> None:
+    def use_local_classes() -> list:
+        @dataclass
+        class LocalChild(ImportJsonMixin, ExportJsonMixin):
+            value: Any = field(default=IntStringDescriptor(default=0))
+
+            def __init__(self, **kwargs: Any) -> None:
+                ImportJsonMixin.__init__(self, **kwargs)
+
+        @fast_init
+        @dataclass
+        class LocalParent(ImportJsonMixin, ExportJsonMixin, FlatExportJsonMixin):
+            child: Any = field(
+                default=SingleObjectDescriptor(LocalChild, optional=False)
+            )
+            name: str = ""
+
+        model = LocalParent(value="3", name="local")
+        assert ExportJsonMixin.to_json(model) == {
+            "child": {"value": 3},
+            "name": "local",
+        }
+        assert FlatExportJsonMixin.to_json(model, use_prefix=True) == {
+            "child.value": 3,
+            "name": "local",
+        }
+        return [weakref.ref(LocalChild), weakref.ref(LocalParent)]
+
+    class_refs = use_local_classes()
+    # the second pass frees what the cache entries of the first one held
+    gc.collect()
+    gc.collect()
+
+    assert [class_ref() for class_ref in class_refs] == [None, None]